@@ -1,51 +1,43 @@
+import hashlib
 import os
-import pandas as pd
+import shutil
+import stat
+import subprocess
+import tempfile
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from string import Template
+from typing import Optional
+from python_calamine import CalamineWorkbook
 
 
-class BeamReportGenerator:
-    """
-    A class to generate professional PDF engineering reports for beam analysis.
-    
-    """
-    
-    def __init__(self, excel_path: str, beam_image_path: str, output_name: str = "Beam_Analysis_Report"):
-        """
-        Initialize the BeamReportGenerator.
-        
-        Args:
-            excel_path: Path to the Excel file with force data
-            beam_image_path: Path to the beam diagram image
-            output_name: Output PDF filename (default: Beam_Analysis_Report)
-        """
-        self.excel_path = excel_path
-        self.beam_image_path = beam_image_path
-        self.output_name = output_name
-        self.data = None
-        self.beam_length = 0
-        
-    def load_data(self) -> None:
-        """
-        Load and process data from the Excel file.
+# Columns read from the force table
+FORCE_COLUMNS = ['x', 'Shear force', 'Bending Moment']
 
-        """
-        print("[INFO] Loading data from Excel file...")
-        self.data = pd.read_excel(self.excel_path)
-        
-        # Calculate beam length from the maximum x value
-        self.beam_length = self.data['x'].max()
-        
-        print(f"[INFO] Loaded {len(self.data)} data points")
-        print(f"[INFO] Beam length: {self.beam_length} m")
-        
-    def _create_preamble(self) -> str:
-        """
-        Create the LaTeX document preamble with all required packages.
-        
-        Returns:
-            String containing the LaTeX preamble
-        """
-        preamble = r"""
+# Force tables longer than this split the shear with the Numba kernel
+NUMBA_MIN_POINTS = 10_000
+
+# Write buffer for the .tex file (1 MiB)
+TEX_WRITE_BUFFER = 1 << 20
+
+# The preamble format is dumped and the report is compiled in private
+# directories here, RAM-backed where the OS provides one
+SCRATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+# Auxiliary files that decide whether a second pdflatex pass is needed
+REFERENCE_EXTENSIONS = ['.aux', '.toc', '.out']
+
+# Name of the precompiled preamble format cached next to the report
+PREAMBLE_FORMAT = "beam_preamble"
+
+# ============================================
+# LATEX TEMPLATES
+# ============================================
+# Sections with variable parts are string.Template objects, so literal
+# dollar signs for LaTeX math are written as $$.
+
+PREAMBLE = r"""
 \documentclass[12pt, a4paper]{report}
 
 % ============================================
@@ -80,7 +72,7 @@ class BeamReportGenerator:
 % ============================================
 % PGFPLOTS CONFIGURATION
 % ============================================
-\pgfplotsset{compat=1.18}
+\pgfplotsset{compat=1.18, table/col sep=space}
 
 % ============================================
 % COLOR DEFINITIONS
@@ -123,18 +115,9 @@ class BeamReportGenerator:
 
 \begin{document}
 """
-        return preamble
-    
-    def _create_title_page(self) -> str:
-        """
-        Create a professional title page for the report.
-        
-        Returns:
-            String containing LaTeX code for the title page
-        """
-        current_date = datetime.now().strftime("%B %d, %Y")
-        
-        title_page = r"""
+
+
+TITLE_PAGE_TEMPLATE = Template(r"""
 % ============================================
 % TITLE PAGE
 % ============================================
@@ -171,7 +154,7 @@ class BeamReportGenerator:
     \vspace{3cm}
     
     % Date
-    {\large\textbf{Date:} """ + current_date + r""" \par}
+    {\large\textbf{Date:} ${date} \par}
     
     \vfill
     
@@ -183,17 +166,10 @@ class BeamReportGenerator:
     {\small Generated using Python and \LaTeX{} \par}
     
 \end{titlepage}
-"""
-        return title_page
-    
-    def _create_toc(self) -> str:
-        """
-        Create the table of contents.
-        
-        Returns:
-            String containing LaTeX code for the TOC
-        """
-        toc = r"""
+""")
+
+
+TABLE_OF_CONTENTS = r"""
 % ============================================
 % TABLE OF CONTENTS
 % ============================================
@@ -201,19 +177,9 @@ class BeamReportGenerator:
 \thispagestyle{empty}
 \newpage
 """
-        return toc
-    
-    def _create_introduction(self) -> str:
-        """
-        Create the introduction section with the beam diagram.
-        
-        Returns:
-            String containing LaTeX code for the introduction
-        """
-        # Convert Windows path to forward slashes for LaTeX
-        image_path = self.beam_image_path.replace("\\", "/")
-        
-        introduction = r"""
+
+
+INTRODUCTION_TEMPLATE = Template(r"""
 % ============================================
 % INTRODUCTION
 % ============================================
@@ -244,14 +210,14 @@ The beam under analysis has the following configuration:
 
 \begin{figure}[H]
     \centering
-    \includegraphics[width=0.85\textwidth]{""" + image_path + r"""}
+    \includegraphics[width=0.85\textwidth]{${image_path}}
     \caption{Simply Supported Beam with Pinned and Roller Supports}
     \label{fig:beam_diagram}
 \end{figure}
 
 \textbf{Beam Parameters:}
 \begin{itemize}
-    \item \textbf{Total Length:} """ + f"{self.beam_length:.1f}" + r""" meters
+    \item \textbf{Total Length:} ${beam_length} meters
     \item \textbf{Left Support:} Pinned support (restricts horizontal and vertical displacement)
     \item \textbf{Right Support:} Roller support (restricts only vertical displacement)
     \item \textbf{Loading:} Uniformly distributed load
@@ -270,21 +236,10 @@ The objectives of this structural analysis are:
 \end{enumerate}
 
 \newpage
-"""
-        return introduction
-    
-    def _create_data_table(self) -> str:
-        """
-        Create the input data table as a LaTeX tabular.
-        
-        This creates a professional table with selectable text,
-        not an embedded image.
-        
-        Returns:
-            String containing LaTeX code for the data table
-        """
-        # Start the chapter and table
-        table_section = r"""
+""")
+
+
+DATA_TABLE_HEADER = r"""
 % ============================================
 % INPUT DATA
 % ============================================
@@ -308,19 +263,12 @@ structural analysis calculations.
         \textbf{[meters]} & \textbf{[kN]} & \textbf{[kN$\cdot$m]} \\
         \hline
 """
-        
-        # Add data rows from the DataFrame
-        for idx, row in self.data.iterrows():
-            x_val = row['x']
-            shear = row['Shear force']
-            moment = row['Bending Moment']
-            
-            # Format the row with proper alignment
-            table_section += f"        {x_val:.1f} & {shear:.2f} & {moment:.2f} \\\\\n"
-            table_section += "        \\hline\n"
-        
-        # Close the table
-        table_section += r"""    \end{tabular}
+
+
+# One row of the data table, formatted by np.savetxt
+DATA_TABLE_ROW = "        %.1f & %.2f & %.2f \\\\\n        \\hline"
+
+DATA_TABLE_FOOTER_TEMPLATE = Template(r"""    \end{tabular}
 \end{table}
 
 \section{Data Interpretation}
@@ -328,42 +276,17 @@ structural analysis calculations.
 From the table above, we can observe:
 
 \begin{itemize}
-    \item \textbf{Maximum Positive Shear Force:} """ + f"{self.data['Shear force'].max():.2f}" + r""" kN (at x = """ + f"{self.data.loc[self.data['Shear force'].idxmax(), 'x']:.1f}" + r""" m)
-    \item \textbf{Maximum Negative Shear Force:} """ + f"{self.data['Shear force'].min():.2f}" + r""" kN (at x = """ + f"{self.data.loc[self.data['Shear force'].idxmin(), 'x']:.1f}" + r""" m)
-    \item \textbf{Maximum Bending Moment:} """ + f"{self.data['Bending Moment'].max():.2f}" + r""" kN$\cdot$m (at x = """ + f"{self.data.loc[self.data['Bending Moment'].idxmax(), 'x']:.1f}" + r""" m)
-    \item \textbf{Zero Shear Location:} x = """ + f"{self.data.loc[self.data['Shear force'] == 0, 'x'].values[0] if 0 in self.data['Shear force'].values else 'N/A'}" + r""" m (point of maximum moment)
+    \item \textbf{Maximum Positive Shear Force:} ${max_shear} kN (at x = ${max_shear_x} m)
+    \item \textbf{Maximum Negative Shear Force:} ${min_shear} kN (at x = ${min_shear_x} m)
+    \item \textbf{Maximum Bending Moment:} ${max_moment} kN$$\cdot$$m (at x = ${max_moment_x} m)
+    \item \textbf{Zero Shear Location:} x = ${zero_shear_x} m (point of maximum moment)
 \end{itemize}
 
 \newpage
-"""
-        return table_section
-    
-    def _create_sfd_diagram(self) -> str:
-        """
-        Create the Shear Force Diagram using TikZ/pgfplots.
-        
-        Creates a professional bar chart with positive values in blue
-        and negative values in red.
-        
-        Returns:
-            String containing LaTeX code for the SFD
-        """
-        # Prepare data for positive and negative bars
-        positive_coords = ""
-        negative_coords = ""
-        
-        for idx, row in self.data.iterrows():
-            x_val = row['x']
-            shear = row['Shear force']
-            
-            if shear >= 0:
-                positive_coords += f"            ({x_val}, {shear})\n"
-                negative_coords += f"            ({x_val}, 0)\n"
-            else:
-                positive_coords += f"            ({x_val}, 0)\n"
-                negative_coords += f"            ({x_val}, {shear})\n"
-        
-        sfd_section = r"""
+""")
+
+
+SFD_TEMPLATE = Template(r"""
 % ============================================
 % SHEAR FORCE DIAGRAM
 % ============================================
@@ -385,10 +308,10 @@ and negative shear forces are shown in \textcolor{shearnegative}{\textbf{red}}.
             ylabel={Shear Force (kN)},
             title={\textbf{Shear Force Diagram}},
             xmin=-0.5,
-            xmax=""" + f"{self.beam_length + 0.5}" + r""",
-            ymin=""" + f"{self.data['Shear force'].min() - 10}" + r""",
-            ymax=""" + f"{self.data['Shear force'].max() + 10}" + r""",
-            xtick={""" + ",".join([str(x) for x in self.data['x']]) + r"""},
+            xmax=${xmax},
+            ymin=${ymin},
+            ymax=${ymax},
+            xtick={${xticks}},
             grid=both,
             grid style={line width=0.2pt, draw=gray!30},
             major grid style={line width=0.4pt, draw=gray!50},
@@ -411,20 +334,18 @@ and negative shear forces are shown in \textcolor{shearnegative}{\textbf{red}}.
         \addplot[
             fill=shearpositive,
             draw=shearpositive!80!black,
-        ] coordinates {
-""" + positive_coords + r"""        };
+        ] table[x=x, y=y] {${sfd_pos_file}};
         \addlegendentry{Positive Shear}
         
         % Negative Shear Force (Red)
         \addplot[
             fill=shearnegative,
             draw=shearnegative!80!black,
-        ] coordinates {
-""" + negative_coords + r"""        };
+        ] table[x=x, y=y] {${sfd_neg_file}};
         \addlegendentry{Negative Shear}
         
         % Zero line
-        \draw[black, thick, dashed] (axis cs:-0.5,0) -- (axis cs:""" + f"{self.beam_length + 0.5}" + r""",0);
+        \draw[black, thick, dashed] (axis cs:-0.5,0) -- (axis cs:${xmax},0);
         
         \end{axis}
     \end{tikzpicture}
@@ -443,26 +364,10 @@ and negative shear forces are shown in \textcolor{shearnegative}{\textbf{red}}.
 \end{itemize}
 
 \newpage
-"""
-        return sfd_section
-    
-    def _create_bmd_diagram(self) -> str:
-        """
-        Create the Bending Moment Diagram using TikZ/pgfplots.
-        
-        Creates a professional bar chart with colored bars and legend.
-        
-        Returns:
-            String containing LaTeX code for the BMD
-        """
-        # Prepare coordinates for the bar chart
-        coords = ""
-        for idx, row in self.data.iterrows():
-            x_val = row['x']
-            moment = row['Bending Moment']
-            coords += f"            ({x_val}, {moment})\n"
-        
-        bmd_section = r"""
+""")
+
+
+BMD_TEMPLATE = Template(r"""
 \section{Bending Moment Diagram (BMD)}
 
 The Bending Moment Diagram shows the variation of internal bending moment along 
@@ -476,13 +381,13 @@ the length of the beam. Positive (sagging) moments are shown in
             width=0.95\textwidth,
             height=8cm,
             xlabel={Position along beam (m)},
-            ylabel={Bending Moment (kN$\cdot$m)},
+            ylabel={Bending Moment (kN$$\cdot$$m)},
             title={\textbf{Bending Moment Diagram}},
             xmin=-0.5,
-            xmax=""" + f"{self.beam_length + 0.5}" + r""",
+            xmax=${xmax},
             ymin=-10,
-            ymax=""" + f"{self.data['Bending Moment'].max() + 20}" + r""",
-            xtick={""" + ",".join([str(x) for x in self.data['x']]) + r"""},
+            ymax=${ymax},
+            xtick={${xticks}},
             grid=both,
             grid style={line width=0.2pt, draw=gray!30},
             major grid style={line width=0.4pt, draw=gray!50},
@@ -505,12 +410,11 @@ the length of the beam. Positive (sagging) moments are shown in
         \addplot[
             fill=momentpositive,
             draw=momentpositive!80!black,
-        ] coordinates {
-""" + coords + r"""        };
+        ] table[x=x, y=y] {${bmd_file}};
         \addlegendentry{Bending Moment (Sagging)}
         
         % Zero line
-        \draw[black, thick, dashed] (axis cs:-0.5,0) -- (axis cs:""" + f"{self.beam_length + 0.5}" + r""",0);
+        \draw[black, thick, dashed] (axis cs:-0.5,0) -- (axis cs:${xmax},0);
         
         \end{axis}
     \end{tikzpicture}
@@ -522,27 +426,17 @@ the length of the beam. Positive (sagging) moments are shown in
 
 \begin{itemize}
     \item The bending moment is zero at both supports (simply supported conditions)
-    \item The bending moment is maximum at the center of the beam (x = """ + f"{self.beam_length/2:.1f}" + r""" m)
-    \item Maximum bending moment value: """ + f"{self.data['Bending Moment'].max():.2f}" + r""" kN$\cdot$m
+    \item The bending moment is maximum at the center of the beam (x = ${mid_span} m)
+    \item Maximum bending moment value: ${max_moment} kN$$\cdot$$m
     \item The BMD follows a parabolic curve for uniformly distributed loads
     \item The slope of the BMD at any point equals the shear force at that point
 \end{itemize}
 
 \newpage
-"""
-        return bmd_section
-    
-    def _create_conclusion(self) -> str:
-        """
-        Create the conclusion section of the report.
-        
-        Returns:
-            String containing LaTeX code for the conclusion
-        """
-        max_shear = self.data['Shear force'].abs().max()
-        max_moment = self.data['Bending Moment'].max()
-        
-        conclusion = r"""
+""")
+
+
+CONCLUSION_TEMPLATE = Template(r"""
 % ============================================
 % CONCLUSION
 % ============================================
@@ -562,11 +456,11 @@ supported beam with the following key findings:
         \rowcolor{titleblue!20}
         \textbf{Parameter} & \textbf{Value} & \textbf{Location} \\
         \hline
-        Maximum Positive Shear & """ + f"{self.data['Shear force'].max():.2f}" + r""" kN & x = 0.0 m \\
+        Maximum Positive Shear & ${max_shear} kN & x = 0.0 m \\
         \hline
-        Maximum Negative Shear & """ + f"{self.data['Shear force'].min():.2f}" + r""" kN & x = """ + f"{self.beam_length:.1f}" + r""" m \\
+        Maximum Negative Shear & ${min_shear} kN & x = ${beam_length} m \\
         \hline
-        Maximum Bending Moment & """ + f"{max_moment:.2f}" + r""" kN$\cdot$m & x = """ + f"{self.beam_length/2:.1f}" + r""" m \\
+        Maximum Bending Moment & ${max_moment} kN$$\cdot$$m & x = ${mid_span} m \\
         \hline
     \end{tabular}
 \end{table}
@@ -600,17 +494,333 @@ This report was automatically generated using:
 \end{itemize}
 
 \end{document}
-"""
-        return conclusion
+""")
+
+
+# Compiled shear split kernel, built on first use (False if Numba is missing)
+_split_shear_kernel = None
+
+
+def _get_split_shear_kernel():
+    """
+    Get the parallel Numba kernel that splits shear values.
+    
+    Numba is optional and slow to import, so it is only imported the
+    first time a large force table needs the kernel.
+    
+    Returns:
+        The compiled kernel, or None if Numba is not installed
+    """
+    global _split_shear_kernel
+    
+    if _split_shear_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _split_shear_kernel = False
+            return None
+        
+        @numba.njit(parallel=True, cache=True)
+        def kernel(shear, positive, negative):
+            for i in numba.prange(len(shear)):
+                if shear[i] >= 0:
+                    positive[i] = shear[i]
+                    negative[i] = 0.0
+                elif shear[i] < 0:
+                    positive[i] = 0.0
+                    negative[i] = shear[i]
+                else:
+                    # NaN is zeroed in both, matching the np.where path
+                    positive[i] = 0.0
+                    negative[i] = 0.0
+        
+        _split_shear_kernel = kernel
+    
+    return _split_shear_kernel or None
+
+
+def split_shear(shear: np.ndarray) -> tuple:
+    """
+    Split shear force values into positive and negative bar heights.
+    
+    Each position keeps its value in one of the two arrays and is zero in
+    the other. Large arrays use a parallel Numba kernel when Numba is
+    installed; otherwise np.where is used.
+    
+    Args:
+        shear: Array of shear force values
+    
+    Returns:
+        Tuple of (positive, negative) arrays
+    """
+    if len(shear) > NUMBA_MIN_POINTS:
+        kernel = _get_split_shear_kernel()
+        if kernel is not None:
+            positive = np.empty_like(shear)
+            negative = np.empty_like(shear)
+            kernel(shear, positive, negative)
+            return positive, negative
+    
+    return np.where(shear >= 0, shear, 0.0), np.where(shear < 0, shear, 0.0)
+
+
+class BeamReportGenerator:
+    """
+    A class to generate professional PDF engineering reports for beam analysis.
+    
+    """
+    
+    def __init__(self, excel_path: str, beam_image_path: str, output_name: str = "Beam_Analysis_Report"):
+        """
+        Initialize the BeamReportGenerator.
+        
+        Args:
+            excel_path: Path to the Excel file with force data
+            beam_image_path: Path to the beam diagram image
+            output_name: Output PDF filename (default: Beam_Analysis_Report)
+        """
+        self.excel_path = excel_path
+        self.beam_image_path = beam_image_path
+        self.output_name = output_name
+        self.beam_length = 0
+        
+        # Report date and LaTeX-friendly image path (forward slashes)
+        self._date_str = datetime.now().strftime("%B %d, %Y")
+        self._image_path_tex = beam_image_path.replace("\\", "/")
+        
+        # NumPy arrays of the force columns and their critical values,
+        # populated once by load_data()
+        self._x = None
+        self._sf = None
+        self._bm = None
+        self.sf_max = None
+        self.sf_min = None
+        self.sf_argmax = None
+        self.sf_argmin = None
+        self.bm_max = None
+        self.bm_argmax = None
+        self.zero_shear_x = None
+        self._xtick_str = None
+        
+    def load_data(self) -> None:
+        """
+        Load and process data from the Excel file.
+
+        """
+        print("[INFO] Loading data from Excel file...")
+        # Read the first sheet with calamine and keep only the force columns
+        workbook = CalamineWorkbook.from_path(self.excel_path)
+        header, *rows = workbook.get_sheet_by_index(0).to_python()
+        columns = [header.index(name) for name in FORCE_COLUMNS]
+        
+        # Skip rows with no force data (e.g. blank rows above a stray note);
+        # a partly filled row is an error in the table
+        force_rows = []
+        for row_number, row in enumerate(rows, start=2):
+            cells = [row[i] for i in columns]
+            empty = [cell in ('', None) for cell in cells]
+            if all(empty):
+                continue
+            if any(empty):
+                name = FORCE_COLUMNS[empty.index(True)]
+                raise ValueError(
+                    f"Missing '{name}' value in row {row_number} of {self.excel_path}"
+                )
+            force_rows.append(cells)
+        
+        values = np.array(force_rows, dtype=np.float64)
+        self._x, self._sf, self._bm = np.ascontiguousarray(values.T)
+        
+        # Calculate beam length from the maximum x value
+        self.beam_length = self._x.max()
+        
+        # Cache the critical values used throughout the report
+        self.sf_max = self._sf.max()
+        self.sf_min = self._sf.min()
+        self.sf_argmax = int(self._sf.argmax())
+        self.sf_argmin = int(self._sf.argmin())
+        self.bm_max = self._bm.max()
+        self.bm_argmax = int(self._bm.argmax())
+        
+        zero_shear = self._sf == 0
+        self.zero_shear_x = self._x[zero_shear][0] if zero_shear.any() else None
+        
+        # Tick positions shared by the SFD and BMD axes
+        self._xtick_str = ",".join(map(str, self._x))
+        
+        print(f"[INFO] Loaded {len(self._x)} data points")
+        print(f"[INFO] Beam length: {self.beam_length} m")
+        
+    def _create_preamble(self) -> str:
+        """
+        Create the LaTeX document preamble with all required packages.
+        
+        Returns:
+            String containing the LaTeX preamble
+        """
+        return PREAMBLE
+    
+    def _create_title_page(self) -> str:
+        """
+        Create a professional title page for the report.
+        
+        Returns:
+            String containing LaTeX code for the title page
+        """
+        return TITLE_PAGE_TEMPLATE.substitute(date=self._date_str)
+    
+    def _create_toc(self) -> str:
+        """
+        Create the table of contents.
+        
+        Returns:
+            String containing LaTeX code for the TOC
+        """
+        return TABLE_OF_CONTENTS
+    
+    def _create_introduction(self) -> str:
+        """
+        Create the introduction section with the beam diagram.
+        
+        Returns:
+            String containing LaTeX code for the introduction
+        """
+        return INTRODUCTION_TEMPLATE.substitute(
+            image_path=self._image_path_tex,
+            beam_length=f"{self.beam_length:.1f}",
+        )
+    
+    def _write_data_table(self, f) -> None:
+        """
+        Write the input data table section to an open text file.
+        
+        This creates a professional table with selectable text, not an
+        embedded image. The rows are formatted by np.savetxt straight
+        from the cached arrays, so the table is never built up as one
+        string.
+        
+        Args:
+            f: Writable text file object
+        """
+        # Start the chapter and table
+        f.write(DATA_TABLE_HEADER)
+        
+        # Add data rows from the cached arrays
+        np.savetxt(f, np.column_stack([self._x, self._sf, self._bm]), fmt=DATA_TABLE_ROW)
+        
+        # Close the table
+        zero_shear_x = self.zero_shear_x if self.zero_shear_x is not None else 'N/A'
+        f.write(DATA_TABLE_FOOTER_TEMPLATE.substitute(
+            max_shear=f"{self.sf_max:.2f}",
+            max_shear_x=f"{self._x[self.sf_argmax]:.1f}",
+            min_shear=f"{self.sf_min:.2f}",
+            min_shear_x=f"{self._x[self.sf_argmin]:.1f}",
+            max_moment=f"{self.bm_max:.2f}",
+            max_moment_x=f"{self._x[self.bm_argmax]:.1f}",
+            zero_shear_x=f"{zero_shear_x}",
+        ))
+    
+    def _plot_data_file(self, name: str) -> str:
+        """
+        Get the filename of an external plot data table.
+        
+        Args:
+            name: Short name of the data series (e.g. 'sfd_pos')
+        
+        Returns:
+            Filename of the .dat file, relative to the output directory
+        """
+        return f"{self.output_name}_{name}.dat"
+    
+    def _write_plot_data(self, output_dir: str) -> None:
+        """
+        Write the SFD and BMD data series to external .dat tables.
+        
+        The diagrams read these files with \\addplot table, which lets
+        pgfplots use its numeric table reader instead of parsing every
+        point as an inline coordinate.
+        
+        Args:
+            output_dir: Directory where the .dat files are written
+        """
+        # Split shear into positive and negative bars
+        positive, negative = split_shear(self._sf)
+        series = {
+            'sfd_pos': positive,
+            'sfd_neg': negative,
+            'bmd': self._bm,
+        }
+        
+        for name, values in series.items():
+            np.savetxt(
+                os.path.join(output_dir, self._plot_data_file(name)),
+                np.column_stack([self._x, values]),
+                fmt='%.4f',
+                header='x y',
+                comments='',
+            )
+    
+    def _create_sfd_diagram(self) -> str:
+        """
+        Create the Shear Force Diagram using TikZ/pgfplots.
+        
+        Creates a professional bar chart with positive values in blue
+        and negative values in red.
+        
+        Returns:
+            String containing LaTeX code for the SFD
+        """
+        return SFD_TEMPLATE.substitute(
+            xmax=f"{self.beam_length + 0.5}",
+            ymin=f"{self.sf_min - 10}",
+            ymax=f"{self.sf_max + 10}",
+            xticks=self._xtick_str,
+            sfd_pos_file=self._plot_data_file('sfd_pos'),
+            sfd_neg_file=self._plot_data_file('sfd_neg'),
+        )
+    
+    def _create_bmd_diagram(self) -> str:
+        """
+        Create the Bending Moment Diagram using TikZ/pgfplots.
+        
+        Creates a professional bar chart with colored bars and legend.
+        
+        Returns:
+            String containing LaTeX code for the BMD
+        """
+        return BMD_TEMPLATE.substitute(
+            xmax=f"{self.beam_length + 0.5}",
+            ymax=f"{self.bm_max + 20}",
+            xticks=self._xtick_str,
+            bmd_file=self._plot_data_file('bmd'),
+            mid_span=f"{self.beam_length/2:.1f}",
+            max_moment=f"{self.bm_max:.2f}",
+        )
+    
+    def _create_conclusion(self) -> str:
+        """
+        Create the conclusion section of the report.
+        
+        Returns:
+            String containing LaTeX code for the conclusion
+        """
+        return CONCLUSION_TEMPLATE.substitute(
+            max_shear=f"{self.sf_max:.2f}",
+            min_shear=f"{self.sf_min:.2f}",
+            max_moment=f"{self.bm_max:.2f}",
+            beam_length=f"{self.beam_length:.1f}",
+            mid_span=f"{self.beam_length/2:.1f}",
+        )
     
     def generate_report(self) -> str:
         """
         Generate the complete LaTeX document and compile to PDF.
         
         This method orchestrates the entire report generation process:
+        0. Returns the existing PDF if none of the inputs have changed
         1. Loads data from Excel
-        2. Generates all LaTeX sections
-        3. Writes the .tex file
+        2. Writes the plot data tables
+        3. Generates all LaTeX sections into the .tex file
         4. Compiles to PDF using pdflatex
         
         Returns:
@@ -620,73 +830,338 @@ This report was automatically generated using:
         print("BEAM ANALYSIS REPORT GENERATOR")
         print("=" * 60)
         
-        # Step 1: Load the data
-        self.load_data()
+        output_dir = os.path.dirname(self.excel_path)
+        pdf_path = os.path.join(output_dir, f"{self.output_name}.pdf")
+        hash_path = f"{pdf_path}.hash"
         
-        # Step 2: Generate LaTeX content
-        print("[INFO] Generating LaTeX document...")
+        # Step 0: Reuse the previous PDF when the inputs are unchanged
+        input_digest = self._input_digest()
+        if input_digest and os.path.exists(pdf_path) and os.path.exists(hash_path):
+            with open(hash_path, 'r', encoding='utf-8') as f:
+                if f.read().strip() == input_digest:
+                    print(f"[INFO] Inputs unchanged, reusing: {pdf_path}")
+                    return pdf_path
         
-        latex_content = ""
-        latex_content += self._create_preamble()
-        latex_content += self._create_title_page()
-        latex_content += self._create_toc()
-        latex_content += self._create_introduction()
-        latex_content += self._create_data_table()
-        latex_content += self._create_sfd_diagram()
-        latex_content += self._create_bmd_diagram()
-        latex_content += self._create_conclusion()
+        # The stored digest no longer describes the PDF once we rebuild it
+        if os.path.exists(hash_path):
+            os.remove(hash_path)
         
-        # Step 3: Write the .tex file
-        tex_path = os.path.join(os.path.dirname(self.excel_path), f"{self.output_name}.tex")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Precompile the preamble while the data is loaded and formatted
+            fmt_future = executor.submit(self._ensure_preamble_fmt, output_dir)
+            
+            # Step 1: Load the data
+            self.load_data()
+            
+            # Step 2: Write the plot data tables
+            self._write_plot_data(output_dir)
+            
+            # Step 3: Generate the LaTeX sections straight into the .tex file
+            print("[INFO] Generating LaTeX document...")
+            tex_path = os.path.join(output_dir, f"{self.output_name}.tex")
+            
+            print(f"[INFO] Writing LaTeX file: {tex_path}")
+            with open(tex_path, 'w', encoding='utf-8', buffering=TEX_WRITE_BUFFER) as f:
+                f.write(self._create_preamble())
+                f.write(self._create_title_page())
+                f.write(self._create_toc())
+                f.write(self._create_introduction())
+                self._write_data_table(f)
+                f.write(self._create_sfd_diagram())
+                f.write(self._create_bmd_diagram())
+                f.write(self._create_conclusion())
+            
+            # Step 4: Compile to PDF
+            print("[INFO] Compiling LaTeX to PDF...")
+            
+            # Inputs are read from the output directory, while the
+            # auxiliary files and the PDF are written to build_dir
+            build_dir, persistent = self._build_dir(pdf_path)
+            command = [
+                'pdflatex',
+                '-interaction=nonstopmode',
+                '-halt-on-error',
+                f"-output-directory={build_dir}",
+            ]
+            
+            # Load the preamble from a precompiled format when one is available
+            fmt_option = f"-fmt={PREAMBLE_FORMAT}"
+            if fmt_future.result():
+                command.append(fmt_option)
+            command.append(f"{self.output_name}.tex")
+            
+            # Run pdflatex up to twice for TOC and references
+            compiled = True
+            for run in range(2):
+                references = self._reference_digest(build_dir)
+                print(f"[INFO] pdflatex run {run + 1}/2...")
+                returncode = self._run_pdflatex(command, output_dir)
+                if returncode is None:
+                    print("[ERROR] pdflatex not found. Make sure a LaTeX distribution is on PATH.")
+                    compiled = False
+                    break
+                
+                # A format from another pdflatex build fails to load, so
+                # retry without it and stop using it if that works
+                if returncode != 0 and fmt_option in command:
+                    retry_command = [arg for arg in command if arg != fmt_option]
+                    if self._run_pdflatex(retry_command, output_dir) == 0:
+                        print("[WARNING] Precompiled preamble could not be loaded, compiling without it")
+                        self._discard_preamble_fmt(output_dir)
+                        command = retry_command
+                        returncode = 0
+                
+                if returncode != 0:
+                    print(f"[WARNING] pdflatex returned non-zero exit code: {returncode}")
+                    compiled = False
+                    break
+                elif self._reference_digest(build_dir) == references:
+                    # The TOC and labels were already up to date
+                    break
+            
+            # Keep only the PDF in the output directory
+            built_pdf = os.path.join(build_dir, f"{self.output_name}.pdf")
+            if os.path.exists(built_pdf):
+                shutil.move(built_pdf, pdf_path)
+            
+            log_path = os.path.join(output_dir, f"{self.output_name}.log")
+            if compiled:
+                # A log kept from an earlier failed build no longer applies
+                if os.path.exists(log_path):
+                    os.remove(log_path)
+            else:
+                # Keep the log for diagnosis; the auxiliary files of the
+                # failed run are dropped below, as they could break the next one
+                built_log = os.path.join(build_dir, f"{self.output_name}.log")
+                if os.path.exists(built_log):
+                    shutil.copy(built_log, log_path)
+            if not (compiled and persistent):
+                shutil.rmtree(build_dir, ignore_errors=True)
+            
+            if compiled and os.path.exists(pdf_path):
+                # Only a clean compile is trusted for reuse on the next run
+                if input_digest:
+                    with open(hash_path, 'w', encoding='utf-8') as f:
+                        f.write(input_digest)
+                print("=" * 60)
+                print(f"[SUCCESS] PDF generated: {pdf_path}")
+                print("=" * 60)
+            elif os.path.exists(log_path):
+                print(f"[ERROR] PDF generation failed. Check the pdflatex log for errors: {log_path}")
+            else:
+                print("[ERROR] PDF generation failed.")
         
-        print(f"[INFO] Writing LaTeX file: {tex_path}")
-        with open(tex_path, 'w', encoding='utf-8') as f:
-            f.write(latex_content)
+        return pdf_path
+    
+    def _build_dir(self, pdf_path: str) -> tuple:
+        """
+        Get the directory where the report is compiled.
         
-        # Step 4: Compile to PDF
-        print("[INFO] Compiling LaTeX to PDF...")
-        output_dir = os.path.dirname(self.excel_path)
+        Each user gets one directory per report under SCRATCH_DIR, kept
+        between runs so the auxiliary files of the previous compile can be
+        compared against the new ones. The trade-off is that it outlives
+        the run: it is only cleaned up by the OS (at reboot for /dev/shm)
+        or after a failed build.
         
-        # Run pdflatex twice for TOC and references
-        for run in range(2):
-            print(f"[INFO] pdflatex run {run + 1}/2...")
-            result = os.system(
-                f'cd /d "{output_dir}" && pdflatex -interaction=nonstopmode "{self.output_name}.tex"'
-            )
-            if result != 0:
-                print(f"[WARNING] pdflatex returned non-zero exit code: {result}")
+        SCRATCH_DIR is shared with other users, so an existing directory
+        is only reused if it is a real directory owned by this user and
+        closed to everyone else. Otherwise a fresh temporary directory is
+        used for this run.
         
-        pdf_path = os.path.join(output_dir, f"{self.output_name}.pdf")
+        Args:
+            pdf_path: Path of the PDF being built
         
-        if os.path.exists(pdf_path):
-            print("=" * 60)
-            print(f"[SUCCESS] PDF generated: {pdf_path}")
-            print("=" * 60)
-        else:
-            print("[ERROR] PDF generation failed. Check the .tex file for errors.")
+        Returns:
+            Tuple of (build directory, whether it is kept after the build)
+        """
+        uid = os.getuid() if hasattr(os, 'getuid') else None
+        key = hashlib.blake2b(os.path.abspath(pdf_path).encode('utf-8'), digest_size=8).hexdigest()
+        build_dir = os.path.join(SCRATCH_DIR, f"beam_report_{uid if uid is not None else 'user'}_{key}")
         
-        # Clean up auxiliary files
-        self._cleanup_aux_files(output_dir)
+        try:
+            os.mkdir(build_dir, 0o700)
+            return build_dir, True
+        except FileExistsError:
+            pass
+        except OSError as e:
+            print(f"[WARNING] Could not create build directory {build_dir}: {e}")
+            return tempfile.mkdtemp(dir=SCRATCH_DIR), False
         
-        return pdf_path
+        info = os.lstat(build_dir)
+        if (stat.S_ISDIR(info.st_mode)
+                and (uid is None or info.st_uid == uid)
+                and not info.st_mode & 0o077):
+            return build_dir, True
+        
+        print(f"[WARNING] Not reusing build directory {build_dir}: it is not a private directory of this user")
+        return tempfile.mkdtemp(dir=SCRATCH_DIR), False
     
-    def _cleanup_aux_files(self, output_dir: str) -> None:
+    def _reference_digest(self, build_dir: str) -> str:
         """
-        Clean up auxiliary files generated by LaTeX compilation.
+        Compute a digest of the files that carry the TOC and references.
         
         Args:
-            output_dir: Directory containing the auxiliary files
-        """
-        aux_extensions = ['.aux', '.log', '.out', '.toc']
+            build_dir: Directory containing the auxiliary files
         
-        for ext in aux_extensions:
-            aux_file = os.path.join(output_dir, f"{self.output_name}{ext}")
+        Returns:
+            Hex digest of the current .aux, .toc and .out files
+        """
+        digest = hashlib.blake2b()
+        for ext in REFERENCE_EXTENSIONS:
+            aux_file = os.path.join(build_dir, f"{self.output_name}{ext}")
             if os.path.exists(aux_file):
-                try:
-                    os.remove(aux_file)
-                    print(f"[INFO] Cleaned up: {aux_file}")
-                except Exception as e:
-                    print(f"[WARNING] Could not remove {aux_file}: {e}")
+                with open(aux_file, 'rb') as f:
+                    digest.update(f.read())
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def _input_digest(self) -> Optional[str]:
+        """
+        Compute a digest of everything the generated PDF depends on.
+        
+        Covers the Excel data, the beam image and this script's source,
+        so editing any of them triggers a fresh build.
+        
+        Returns:
+            Hex digest identifying the current inputs, or None if an
+            input file is missing
+        """
+        digest = hashlib.blake2b()
+        for path in (self.excel_path, self.beam_image_path, __file__):
+            if not os.path.exists(path):
+                print(f"[WARNING] Input file not found, skipping the PDF cache: {path}")
+                return None
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+    
+    def _ensure_preamble_fmt(self, output_dir: str) -> bool:
+        """
+        Make sure a precompiled format of the preamble exists.
+        
+        The preamble is dumped to a .fmt file with mylatexformat so that
+        pdflatex does not have to reload every package on each run. The
+        format is keyed by the preamble text and the pdflatex version,
+        stored in a hash file alongside it, and rebuilt only when either
+        changes. A failed dump is recorded under the same key so it is
+        not retried on every build.
+        
+        Args:
+            output_dir: Directory where the format is cached
+        
+        Returns:
+            True if the format is ready to use, False otherwise
+        """
+        try:
+            version = subprocess.run(
+                ['pdflatex', '--version'],
+                capture_output=True,
+                text=True,
+                check=False,
+            ).stdout
+        except FileNotFoundError:
+            return False
+        
+        # A .fmt only loads in the pdflatex build that dumped it
+        preamble = self._create_preamble()
+        digest = hashlib.sha256()
+        digest.update(preamble.encode('utf-8'))
+        digest.update(version.encode('utf-8'))
+        preamble_hash = digest.hexdigest()
+        
+        fmt_path = os.path.join(output_dir, f"{PREAMBLE_FORMAT}.fmt")
+        hash_path = os.path.join(output_dir, f"{PREAMBLE_FORMAT}.hash")
+        
+        cached_hash = None
+        if os.path.exists(hash_path):
+            with open(hash_path, 'r', encoding='utf-8') as f:
+                cached_hash = f.read().strip()
+        
+        if cached_hash == preamble_hash and os.path.exists(fmt_path):
+            return True
+        if cached_hash == f"failed {preamble_hash}":
+            return False
+        
+        print("[INFO] Precompiling preamble format...")
+        with tempfile.TemporaryDirectory(dir=SCRATCH_DIR) as build_dir:
+            # The preamble file is only input to the dump, so it stays in build_dir
+            preamble_tex = os.path.join(build_dir, f"{PREAMBLE_FORMAT}.tex")
+            with open(preamble_tex, 'w', encoding='utf-8') as f:
+                f.write(preamble)
+            
+            result = subprocess.run(
+                [
+                    'pdflatex',
+                    '-ini',
+                    '-interaction=nonstopmode',
+                    f"-jobname={PREAMBLE_FORMAT}",
+                    '&pdflatex',
+                    'mylatexformat.ltx',
+                    f"{PREAMBLE_FORMAT}.tex",
+                ],
+                cwd=build_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+            
+            built_fmt = os.path.join(build_dir, f"{PREAMBLE_FORMAT}.fmt")
+            if result.returncode != 0 or not os.path.exists(built_fmt):
+                print("[WARNING] Could not precompile the preamble, compiling without it")
+                with open(hash_path, 'w', encoding='utf-8') as f:
+                    f.write(f"failed {preamble_hash}")
+                return False
+            
+            shutil.move(built_fmt, fmt_path)
+        
+        with open(hash_path, 'w', encoding='utf-8') as f:
+            f.write(preamble_hash)
+        return True
+    
+    def _discard_preamble_fmt(self, output_dir: str) -> None:
+        """
+        Stop using a precompiled format that pdflatex could not load.
+        
+        The format is deleted and its key is marked as failed, so later
+        builds compile without it until the preamble or pdflatex changes.
+        
+        Args:
+            output_dir: Directory where the format is cached
+        """
+        fmt_path = os.path.join(output_dir, f"{PREAMBLE_FORMAT}.fmt")
+        hash_path = os.path.join(output_dir, f"{PREAMBLE_FORMAT}.hash")
+        
+        if os.path.exists(fmt_path):
+            os.remove(fmt_path)
+        if os.path.exists(hash_path):
+            with open(hash_path, 'r', encoding='utf-8') as f:
+                preamble_hash = f.read().strip()
+            if not preamble_hash.startswith("failed "):
+                with open(hash_path, 'w', encoding='utf-8') as f:
+                    f.write(f"failed {preamble_hash}")
+    
+    def _run_pdflatex(self, command: list, output_dir: str) -> Optional[int]:
+        """
+        Run one pdflatex pass in the output directory.
+        
+        Args:
+            command: pdflatex command line
+            output_dir: Directory the inputs are read from
+        
+        Returns:
+            pdflatex exit code, or None if pdflatex is not installed
+        """
+        try:
+            result = subprocess.run(
+                command,
+                cwd=output_dir or None,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+        except FileNotFoundError:
+            return None
+        return result.returncode
 
 
 def main():